@@ -9,9 +9,9 @@ def search_regex(directory, regex):
     """
     Search files by regex in directory
     :param directory: list of file path
-    :param regex: regex to search
+    :param regex: regex to search, either a pattern string or a compiled pattern
     :return: list of files that match regex
     """
     files = listdir(directory)
-    m = re.compile(regex)
+    m = regex if isinstance(regex, re.Pattern) else re.compile(regex)
     return [join(directory, file) for file in files if m.search(basename(file))]
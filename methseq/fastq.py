@@ -1,10 +1,17 @@
-import gzip
+import re
 from os.path import basename
 from re import search, IGNORECASE
 
 from methseq import search_regex
 
+try:
+    from isal import igzip as gzip
+except ImportError:
+    import gzip
+
 FASTQ_NAME_REGEX = '(?P<sample>.+)_R?[12]\\.fastq(\\.gz)?$'
+FORWARD_FASTQ_REGEX = re.compile('_R?1\\.fastq(\\.gz)?')
+REVERSE_FASTQ_REGEX = re.compile('_R?2\\.fastq(\\.gz)?')
 
 def extract_sample_name(file, regex):
     """
@@ -28,8 +35,8 @@ def collect_fastq_files(directory):
     :param directory: Directory containing paired-end FASTQ files
     :return: two lists with paths to FASTQ files (forward, reverse)
     """
-    forward_files = search_regex(directory, '_R?1\\.fastq(\\.gz)?')
-    reverse_files = search_regex(directory, '_R?2\\.fastq(\\.gz)?')
+    forward_files = search_regex(directory, FORWARD_FASTQ_REGEX)
+    reverse_files = search_regex(directory, REVERSE_FASTQ_REGEX)
 
     forward_len = len(forward_files)
     reverse_len = len(reverse_files)
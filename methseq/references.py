@@ -1,9 +1,7 @@
-from os import walk
+from os import walk, scandir
 from os.path import join, exists, abspath
 
-from methseq import search_regex
-
-FASTA_REGEX = '\\.(fa|fasta)$'
+FASTA_EXTENSIONS = ('.fa', '.fasta')
 
 
 def list_dir(directory):
@@ -16,7 +14,8 @@ def list_dir(directory):
 
 
 def collect_reference_files(directory):
-    genome_files = search_regex(directory, FASTA_REGEX)
+    with scandir(directory) as entries:
+        genome_files = [entry.path for entry in entries if entry.is_file() and entry.name.endswith(FASTA_EXTENSIONS)]
 
     if not genome_files:
         raise Exception('No genome FASTA files in found in' + directory)
@@ -1,4 +1,6 @@
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from itertools import chain
 from json import dump
 from os.path import join, basename, exists
@@ -18,7 +20,7 @@ def submit_workflow(host, workflow, inputs, destination, sleep_time=300, dont_ru
     :param workflow: workflow name
     :param inputs: dict containing inputs data
     :param destination: directory to write all files
-    :param sleep_time: time in seconds to sleep between workflow status check
+    :param sleep_time: maximum time in seconds to sleep between workflow status checks (starts at 1s, doubling)
     :param dont_run: Do not submit workflow to Cromwell. Just create destination directory and write JSON and WDL files
     :param move: Move output files to destination directory instead of copying them.
     """
@@ -35,7 +37,7 @@ def submit_workflow(host, workflow, inputs, destination, sleep_time=300, dont_ru
 
     inputs_file = join(destination, WORKFLOW_INPUT_FILES[workflow])
     with open(inputs_file, 'w') as file:
-        dump(inputs, file, indent=4, sort_keys=True)
+        dump(inputs, file, indent=4)
     click.echo('Inputs JSON file: ' + inputs_file, err=True)
 
     if dont_run:
@@ -52,12 +54,14 @@ def submit_workflow(host, workflow, inputs, destination, sleep_time=300, dont_ru
     click.echo('Starting {} workflow.. Ctrl-C to abort.'.format(workflow), err=True)
 
     try:
+        delay = min(1, sleep_time)
         while True:
-            sleep(sleep_time)
             status = client.status(workflow_id)
             if status != 'Submitted' and status != 'Running':
                 click.echo('Workflow terminated: ' + status, err=True)
                 break
+            sleep(delay)
+            delay = min(delay * 2, sleep_time)
         if status != 'Succeeded':
             exit(1)
     except KeyboardInterrupt:
@@ -66,6 +70,7 @@ def submit_workflow(host, workflow, inputs, destination, sleep_time=300, dont_ru
         exit(1)
 
     outputs = client.outputs(workflow_id)
+    output_files = dict()
     for output in outputs.values():
         if isinstance(output, str):
             files = [output]
@@ -76,11 +81,35 @@ def submit_workflow(host, workflow, inputs, destination, sleep_time=300, dont_ru
 
         for file in files:
             if exists(file):
-                destination_file = join(destination, basename(file))
-                click.echo('Collecting file ' + file, err=True)
-                if move:
-                    shutil.move(file, destination_file)
-                else:
-                    shutil.copyfile(file, destination_file)
+                name = basename(file)
+                if name in output_files:
+                    click.echo('File name collision, {} replaces {}'.format(file, output_files[name]), err=True)
+                output_files[name] = file
             else:
                 click.echo('File not found: ' + file, err=True)
+
+    output_files = list(output_files.values())
+    for file in output_files:
+        click.echo('Collecting file ' + file, err=True)
+
+    collect = partial(collect_file, destination=destination, move=move)
+    if len(output_files) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(output_files))) as executor:
+            list(executor.map(collect, output_files))
+    else:
+        for file in output_files:
+            collect(file)
+
+
+def collect_file(file, destination, move=False):
+    """
+    Copy or move output file into destination
+    :param file: path to output file
+    :param destination: directory to write file
+    :param move: Move output file to destination directory instead of copying it.
+    """
+    destination_file = join(destination, basename(file))
+    if move:
+        shutil.move(file, destination_file)
+    else:
+        shutil.copyfile(file, destination_file)
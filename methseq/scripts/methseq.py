@@ -29,7 +29,7 @@ from ..scripts import submit_workflow
 @click.option('--dont_run', is_flag=True, default=False, show_default=True,
               help='Do not submit workflow to Cromwell. Just create destination directory and write JSON and WDL files')
 @click.option('--sleep', 'sleep_time', default=300, type=click.INT,
-              help='Time to sleep (in seconds) between each workflow status check')
+              help='Maximum time to sleep (in seconds) between workflow status checks', show_default=True)
 @click.option('--move', is_flag=True, default=False,
               help='Move output files to destination directory instead of copying them')
 @click.option('--trimgalore_path_override')
@@ -1,7 +1,10 @@
-from os.path import join, basename
-from zipfile import ZipFile
+from functools import lru_cache
+from importlib.resources import files
+from os.path import join, basename, exists
+from zipfile import ZipFile, BadZipFile
+from zlib import crc32
 
-from pkg_resources import resource_filename
+__all__ = ['WORKFLOW_FILES', 'IMPORTS_FILES', 'WORKFLOW_INPUT_FILES', 'get_workflow_file', 'zip_imports_files']
 
 WORKFLOW_FILES = {'WGBS': 'workflows/wgbs.wdl',
                   'WGBSBatch': 'workflows/wgbs-batch.wdl',
@@ -22,9 +25,11 @@ WORKFLOW_INPUT_FILES = {'WGBS': 'wgbs.inputs.json',
                         'EMSeqBatch': 'emseq-batch.inputs.json'}
 
 
+@lru_cache(maxsize=None)
 def get_workflow_file(workflow):
     """
-    Return package path to workflow file
+    Return package path to workflow file.
+    The package must be installed unzipped (zip_safe=False) for the path to exist on the filesystem
     :param workflow: Workflow name
     :return: path to workflow file
     """
@@ -32,7 +37,7 @@ def get_workflow_file(workflow):
     if workflow not in WORKFLOW_FILES.keys():
         raise Exception('Workflow not found: ' + workflow)
 
-    return resource_filename(__name__, WORKFLOW_FILES[workflow])
+    return str(files(__package__).joinpath(WORKFLOW_FILES[workflow]))
 
 
 def zip_imports_files(workflow, dest_dir):
@@ -47,9 +52,40 @@ def zip_imports_files(workflow, dest_dir):
         return None
 
     zip_file = join(dest_dir, workflow + '.imports.zip')
+    workflow_files = [get_workflow_file(sub_workflow) for sub_workflow in IMPORTS_FILES[workflow]]
+    if is_zip_up_to_date(zip_file, workflow_files):
+        return zip_file
+
     with ZipFile(zip_file, 'w') as file:
-        for sub_workflow in IMPORTS_FILES[workflow]:
-            workflow_file = get_workflow_file(sub_workflow)
+        for workflow_file in workflow_files:
             file.write(workflow_file, basename(workflow_file))
 
     return zip_file
+
+
+def is_zip_up_to_date(zip_file, workflow_files):
+    """
+    Check whether zip file contains exactly the given files with the same content
+    :param zip_file: path to zip file
+    :param workflow_files: list of file paths expected in zip file
+    :return: True if zip file does not need to be rewritten
+    """
+
+    if not exists(zip_file):
+        return False
+
+    try:
+        with ZipFile(zip_file) as file:
+            crcs = {info.filename: info.CRC for info in file.infolist()}
+    except BadZipFile:
+        return False
+
+    if sorted(crcs) != sorted(basename(f) for f in workflow_files):
+        return False
+
+    for workflow_file in workflow_files:
+        with open(workflow_file, 'rb') as file:
+            if crc32(file.read()) != crcs[basename(workflow_file)]:
+                return False
+
+    return True
@@ -1,6 +1,4 @@
-from distutils.core import setup
-
-from setuptools import find_packages
+from setuptools import setup, find_packages
 
 with open("README.md", "r") as fh:
     long_description = fh.read()
@@ -17,7 +15,9 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     requires=['click', 'requests'],
+    python_requires='>=3.9',
     include_package_data=True,
+    zip_safe=False,
     entry_points='''
         [console_scripts]
         methseq=methseq.scripts.methseq:cli